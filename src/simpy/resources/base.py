@@ -7,7 +7,7 @@ These events are triggered once the request has been completed.
 
 """
 from simpy.core import BoundClass
-from simpy.events import Event
+from simpy.events import Event, PENDING
 
 
 class Put(Event):
@@ -25,13 +25,26 @@ class Put(Event):
 
     """
     def __init__(self, resource):
-        super(Put, self).__init__(resource._env)
-        self.resource = resource
-        self.proc = self.env.active_process
+        # NOTE: The following initialization code is inlined from
+        # Event.__init__() for performance reasons.
+        env = resource._env
+        self.env = env
+        self.callbacks = [resource._trigger_get]
+        self._value = PENDING
 
-        resource.put_queue.append(self)
-        self.callbacks.append(resource._trigger_get)
-        resource._trigger_put(None)
+        self.resource = resource
+        self.proc = env.active_process
+
+        queue = resource.put_queue
+        if queue:
+            queue.append(self)
+            resource._trigger_put(None)
+        else:
+            # Fast path: This is the only pending put request, so there is
+            # no need to enqueue it if it can be completed right away.
+            resource._do_put(self)
+            if self._value is PENDING:
+                queue.append(self)
 
     def __enter__(self):
         return self
@@ -69,13 +82,26 @@ class Get(Event):
 
     """
     def __init__(self, resource):
-        super(Get, self).__init__(resource._env)
-        self.resource = resource
-        self.proc = self.env.active_process
+        # NOTE: The following initialization code is inlined from
+        # Event.__init__() for performance reasons.
+        env = resource._env
+        self.env = env
+        self.callbacks = [resource._trigger_put]
+        self._value = PENDING
 
-        resource.get_queue.append(self)
-        self.callbacks.append(resource._trigger_put)
-        resource._trigger_get(None)
+        self.resource = resource
+        self.proc = env.active_process
+
+        queue = resource.get_queue
+        if queue:
+            queue.append(self)
+            resource._trigger_get(None)
+        else:
+            # Fast path: This is the only pending get request, so there is
+            # no need to enqueue it if it can be completed right away.
+            resource._do_get(self)
+            if self._value is PENDING:
+                queue.append(self)
 
     def __enter__(self):
         return self
@@ -161,13 +187,19 @@ class BaseResource(object):
 
         This method is called by :meth:`_trigger_put` for every event in the
         :attr:`put_queue`, as long as the return value does not evaluate
-        ``False``.
+        ``False``. It is also called directly for a new put event if the
+        :attr:`put_queue` is empty; the event is only enqueued if it has not
+        been triggered by this call.
         """
         raise NotImplementedError(self)
 
     def _trigger_put(self, get_event):
-        """This method is called once a new put event has been created or a get
-        event has been processed.
+        """This method is called once a new put event has been enqueued or a
+        get event has been processed.
+
+        A new put event is only enqueued if the :attr:`put_queue` is not
+        empty. Otherwise it is passed to :meth:`_do_put` directly and this
+        method is not called for it.
 
         The method iterates over all put events in the :attr:`put_queue` and
         calls :meth:`_do_put` to check if the conditions for the event are met.
@@ -178,13 +210,15 @@ class BaseResource(object):
         # This code is not very pythonic because the queue interface should be
         # simple (only append(), pop(), __getitem__() and __len__() are
         # required).
+        queue = self.put_queue
+        do_put = self._do_put
         idx = 0
-        while idx < len(self.put_queue):
-            put_event = self.put_queue[idx]
-            proceed = self._do_put(put_event)
-            if not put_event.triggered:
+        while idx < len(queue):
+            put_event = queue[idx]
+            proceed = do_put(put_event)
+            if put_event._value is PENDING:
                 idx += 1
-            elif self.put_queue.pop(idx) != put_event:
+            elif queue.pop(idx) is not put_event:
                 raise RuntimeError('Put queue invariant violated')
 
             if not proceed:
@@ -199,16 +233,22 @@ class BaseResource(object):
 
         This method is called by :meth:`_trigger_get` for every event in the
         :attr:`get_queue`, as long as the return value does not evaluate
-        ``False``.
+        ``False``. It is also called directly for a new get event if the
+        :attr:`get_queue` is empty; the event is only enqueued if it has not
+        been triggered by this call.
         """
         raise NotImplementedError(self)
 
     def _trigger_get(self, put_event):
         """Trigger get events.
 
-        This method is called once a new get event has been created or a put
+        This method is called once a new get event has been enqueued or a put
         event has been processed.
 
+        A new get event is only enqueued if the :attr:`get_queue` is not
+        empty. Otherwise it is passed to :meth:`_do_get` directly and this
+        method is not called for it.
+
         The method iterates over all get events in the :attr:`get_queue` and
         calls :meth:`_do_get` to check if the conditions for the event are met.
         If :meth:`_do_get` returns ``False``, the iteration is stopped early.
@@ -218,13 +258,15 @@ class BaseResource(object):
         # This code is not very pythonic because the queue interface should be
         # simple (only append(), pop(), __getitem__() and __len__() are
         # required).
+        queue = self.get_queue
+        do_get = self._do_get
         idx = 0
-        while idx < len(self.get_queue):
-            get_event = self.get_queue[idx]
-            proceed = self._do_get(get_event)
-            if not get_event.triggered:
+        while idx < len(queue):
+            get_event = queue[idx]
+            proceed = do_get(get_event)
+            if get_event._value is PENDING:
                 idx += 1
-            elif self.get_queue.pop(idx) != get_event:
+            elif queue.pop(idx) is not get_event:
                 raise RuntimeError('Get queue invariant violated')
 
             if not proceed:
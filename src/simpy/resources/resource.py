@@ -28,7 +28,10 @@ processes can define a request priority, and a :class:`PreemptiveResource`
 whose resource users can be preempted by requests with a higher priority.
 
 """
+from operator import attrgetter
+
 from simpy.core import BoundClass
+from simpy.events import PENDING
 from simpy.resources import base
 
 
@@ -37,6 +40,8 @@ class Preempted(object):
     information about the preemption.
 
     """
+    __slots__ = ('by', 'usage_since', 'resource')
+
     def __init__(self, by, usage_since, resource):
         self.by = by
         """The preempting :class:`simpy.events.Process`."""
@@ -61,7 +66,9 @@ class Request(base.Put):
 
     """
     def __exit__(self, exc_type, value, traceback):
-        super(Request, self).__exit__(exc_type, value, traceback)
+        # NOTE: Calls cancel() directly instead of going through
+        # Put.__exit__() for performance reasons.
+        self.cancel()
         self.resource.release(self)
 
 
@@ -96,10 +103,10 @@ class PriorityRequest(Request):
         """Indicates whether the request should preempt a resource user or not
         (:class:`PriorityResource` ignores this flag)."""
 
-        self.time = resource._env.now
+        self.time = time = resource._env.now
         """The time at which the request was made."""
 
-        self.key = (self.priority, self.time, not self.preempt)
+        self.key = (priority, time, not preempt)
         """Key for sorting events. Consists of the priority (lower value is
         more important), the time at which the request was made (earlier
         requests are more important) and finally the preemption flag (preempt
@@ -108,11 +115,16 @@ class PriorityRequest(Request):
         super(PriorityRequest, self).__init__(resource)
 
 
+_get_key = attrgetter('key')
+
+
 class SortedQueue(list):
     """Queue for sorting events by their :attr:`~PriorityRequest.key`
     attribute.
 
     """
+    __slots__ = ('maxlen',)
+
     def __init__(self, maxlen=None):
         super(SortedQueue, self).__init__()
         self.maxlen = maxlen
@@ -127,8 +139,24 @@ class SortedQueue(list):
         if self.maxlen is not None and len(self) >= self.maxlen:
             raise RuntimeError('Cannot append event. Queue is full.')
 
-        super(SortedQueue, self).append(item)
-        super(SortedQueue, self).sort(key=lambda e: e.key)
+        # Request times never decrease. Unless there are many distinct
+        # priorities, a new item therefore usually belongs to the end of the
+        # queue.
+        key = item.key
+        if not self or not key < self[-1].key:
+            super(SortedQueue, self).append(item)
+            return
+
+        # Otherwise, binary search for the position after all items with a
+        # key less than or equal to the new one (like bisect.bisect_right()).
+        lo, hi = 0, len(self) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if key < self[mid].key:
+                hi = mid
+            else:
+                lo = mid + 1
+        self.insert(lo, item)
 
 
 class Resource(base.BaseResource):
@@ -168,16 +196,27 @@ class Resource(base.BaseResource):
     """Release a usage slot."""
 
     def _do_put(self, event):
-        if len(self.users) < self.capacity:
-            self.users.append(event)
-            event.succeed()
+        users = self.users
+        if len(users) < self._capacity:
+            users.append(event)
+            # NOTE: The following code is inlined from Event.succeed() for
+            # performance reasons. The event is known to be untriggered.
+            event._ok = True
+            event._value = None
+            self._env.schedule(event)
 
     def _do_get(self, event):
         try:
             self.users.remove(event.request)
         except ValueError:
+            # The request is not (or no longer) using the resource, e.g.
+            # because it has been cancelled or preempted.
             pass
-        event.succeed()
+        # NOTE: The following code is inlined from Event.succeed() for
+        # performance reasons. The event is known to be untriggered.
+        event._ok = True
+        event._value = None
+        self._env.schedule(event)
 
 
 class PriorityResource(Resource):
@@ -213,14 +252,46 @@ class PreemptiveResource(PriorityResource):
     cause.
 
     """
+    def __init__(self, env, capacity=1):
+        super(PreemptiveResource, self).__init__(env, capacity)
+
+        # The user with the largest key (the first one to be preempted) or
+        # None if it needs to be looked up again.
+        self._preempt_candidate = None
+
+    request = BoundClass(PriorityRequest)
+    """Request a usage slot with the given *priority*."""
+
+    release = BoundClass(Release)
+    """Release a usage slot."""
+
     def _do_put(self, event):
-        if len(self.users) >= self.capacity and event.preempt:
-            # Check if we can preempt another process
-            preempt = sorted(self.users, key=lambda e: e.key)[-1]
+        users = self.users
+        if len(users) >= self._capacity and event.preempt:
+            # Check if we can preempt another process. Only the user with the
+            # largest key is a candidate. If it is not known, scan the users
+            # in reverse so that the most recent one wins ties (max() returns
+            # the first maximal element).
+            preempt = self._preempt_candidate
+            if preempt is None:
+                preempt = max(reversed(users), key=_get_key)
+                self._preempt_candidate = preempt
             if preempt.key > event.key:
-                self.users.remove(preempt)
+                users.remove(preempt)
+                self._preempt_candidate = None
                 preempt.proc.interrupt(Preempted(by=event.proc,
                                                  usage_since=preempt.time,
                                                  resource=self))
 
-        return super(PreemptiveResource, self)._do_put(event)
+        super(PreemptiveResource, self)._do_put(event)
+
+        candidate = self._preempt_candidate
+        if event._value is not PENDING and candidate is not None:
+            if event.key >= candidate.key:
+                self._preempt_candidate = event
+
+    def _do_get(self, event):
+        if event.request is self._preempt_candidate:
+            self._preempt_candidate = None
+
+        super(PreemptiveResource, self)._do_get(event)
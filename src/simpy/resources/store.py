@@ -11,7 +11,7 @@ matching a given criterion.
 from heapq import heappush, heappop
 from collections import namedtuple
 
-from simpy.core import BoundClass
+from simpy.core import BoundClass, Infinity
 from simpy.resources import base
 
 
@@ -59,7 +59,7 @@ class Store(base.BaseResource):
     container is bound to.
 
     """
-    def __init__(self, env, capacity=float('inf')):
+    def __init__(self, env, capacity=Infinity):
         if capacity <= 0:
             raise ValueError('"capacity" must be > 0.')
 
@@ -92,6 +92,7 @@ class PriorityItem(namedtuple('PriorityItem', 'priority item')):
     unorderable items in a :class:`PriorityStore` instance.
 
     """
+    __slots__ = ()
 
     def __lt__(self, other):
         return self.priority < other.priority
@@ -110,6 +111,12 @@ class PriorityStore(Store):
 
     """
 
+    put = BoundClass(StorePut)
+    """Request to put *item* into the store."""
+
+    get = BoundClass(StoreGet)
+    """Request to get an *item* out of the store."""
+
     def _do_put(self, event):
         if len(self.items) < self._capacity:
             heappush(self.items, event.item)
@@ -237,6 +237,24 @@ def test_sorted_queue_maxlen(env):
     env.run()
 
 
+def test_sorted_queue_order():
+    """Items are sorted by their key. Items with equal keys keep the order in
+    which they were appended."""
+    from simpy.resources.resource import SortedQueue
+
+    class Item(object):
+        def __init__(self, name, key):
+            self.name = name
+            self.key = key
+
+    queue = SortedQueue()
+    for name, key in [('a', 1), ('b', 2), ('c', 2), ('d', 0), ('e', 1),
+                      ('f', 3), ('g', 1)]:
+        queue.append(Item(name, key))
+
+    assert [item.name for item in queue] == ['d', 'a', 'e', 'g', 'b', 'c', 'f']
+
+
 def test_get_users(env):
     def process(env, resource):
         with resource.request() as req:
@@ -369,6 +387,64 @@ def test_nested_preemption(env, log):
     assert log == [(1, 0, (p1, 0, res1)), (6, 1), (21, 2, (p3, 20, res0)),
         (26, 3), (31, 4)]
 
+
+def test_preemption_candidate_released(env, log):
+    """A user that has been looked up as preemption candidate but released
+    the resource in the meantime must not be preempted."""
+    def process(id, env, res, delay, prio, preempt, duration, log):
+        yield env.timeout(delay)
+        with res.request(priority=prio, preempt=preempt) as req:
+            try:
+                result = yield req | env.timeout(0)
+                if req not in result:
+                    log.append((env.now, id, 'gave up'))
+                    return
+                yield env.timeout(duration)
+                log.append((env.now, id))
+            except simpy.Interrupt as ir:
+                log.append((env.now, id, ir.cause.by))
+
+    res = simpy.PreemptiveResource(env, 2)
+    env.process(process(0, env, res, 0, 1, True, 10, log))
+    env.process(process(1, env, res, 0, 3, True, 2, log))
+    # Cannot preempt anyone and gives up, but looks up process 1 as the user
+    # to preempt.
+    env.process(process(2, env, res, 1, 5, True, 1, log))
+    # Gets the slot released by process 1, but has a smaller key than it.
+    env.process(process(3, env, res, 3, 2, False, 10, log))
+    p4 = env.process(process(4, env, res, 4, 0, True, 1, log))
+
+    env.run()
+
+    assert log == [(1, 2, 'gave up'), (2, 1), (4, 3, p4), (5, 4), (10, 0)]
+
+
+def test_preemption_candidate_equal_keys(env, log):
+    """Of several users with equal keys, the most recent one is preempted,
+    even if another one has been looked up as preemption candidate
+    before."""
+    def process(id, env, res, delay, prio, duration, log):
+        yield env.timeout(delay)
+        with res.request(priority=prio) as req:
+            try:
+                yield req
+                yield env.timeout(duration)
+                log.append((env.now, id))
+            except simpy.Interrupt as ir:
+                log.append((env.now, id, ir.cause.by))
+
+    res = simpy.PreemptiveResource(env, 2)
+    env.process(process(0, env, res, 0, 1, 1, log))
+    env.process(process(1, env, res, 0, 2, 10, log))
+    # Has the same key as process 1 and is queued, which looks up process 1
+    # as the user to preempt. Becomes a user once process 0 is done.
+    env.process(process(2, env, res, 0, 2, 10, log))
+    p3 = env.process(process(3, env, res, 2, 0, 1, log))
+
+    env.run()
+
+    assert log == [(1, 0), (2, 2, p3), (3, 3), (10, 1)]
+
 #
 # Tests for Container
 #
@@ -703,3 +779,33 @@ def test_immediate_get_request(env):
     request = container.get(1)
     assert not request.triggered
     assert len(container.get_queue) == 1
+
+
+def test_custom_base_environment():
+    """Resources only rely on the public interface of
+    :class:`~simpy.core.BaseEnvironment`."""
+    class Env(simpy.core.BaseEnvironment):
+        def __init__(self):
+            self.scheduled = []
+
+        @property
+        def now(self):
+            return 0
+
+        @property
+        def active_process(self):
+            return None
+
+        def schedule(self, event, priority=1, delay=0):
+            self.scheduled.append(event)
+
+    env = Env()
+    store = simpy.Store(env)
+    put = store.put(1)
+    get = store.get()
+    assert put.triggered and put.proc is None
+    assert get.value == 1
+
+    res = simpy.PriorityResource(env)
+    request = res.request(priority=1)
+    assert request.triggered and request.key == (1, 0, False)